@@ -364,6 +364,46 @@ def show_error(resp: Dict[str, Any]):
     st.error(msg)
     if details:
         st.caption(str(details))
+    failed = resp.get("failed_fields")
+    if failed:
+        st.caption("Failed fields: " + ", ".join([str(x) for x in failed]))
+
+
+RISK_TONES = {"low": "success", "moderate": "info", "high": "warn", "crisis": "error"}
+
+
+def show_analysis(analysis: Dict[str, Any]):
+    risk = str(analysis.get("risk_level", "") or "")
+    if risk:
+        card("Risk level", f"Risk level: {risk}", RISK_TONES.get(risk, "info"))
+
+    emotions = analysis.get("emotions", [])
+    if isinstance(emotions, list) and emotions:
+        st.write("Emotions noticed: " + ", ".join([str(x) for x in emotions]))
+
+    feedback = analysis.get("feedback", "")
+    if isinstance(feedback, str) and feedback.strip():
+        st.subheader("Supportive feedback")
+        st.write(feedback)
+
+    failed = analysis.get("failed_fields", [])
+    if isinstance(failed, list) and failed:
+        st.caption("Not available right now: " + ", ".join([str(x) for x in failed]))
+
+
+def show_plan(plan: Dict[str, Any]):
+    summary = plan.get("summary", "")
+    if isinstance(summary, str) and summary.strip():
+        st.write(summary)
+
+    items = plan.get("items", [])
+    if isinstance(items, list):
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            category = item.get("category", "")
+            suffix = f" _({category})_" if category else ""
+            st.markdown(f"**{item.get('title', '')}**{suffix}  \n{item.get('description', '')}")
 
 
 # ============================================================
@@ -548,12 +588,15 @@ elif choice == "Submit Assessment Answer":
             st.stop()
 
         rep = first_report(resp) or {}
+        if rep.get("error"):
+            show_error(rep)
+            st.stop()
+
         st.success("Your answer has been saved.")
 
-        analysis = rep.get("analysis", "")
-        if isinstance(analysis, str) and analysis.strip():
-            st.subheader("Supportive feedback")
-            st.write(analysis)
+        analysis = rep.get("analysis", {})
+        if isinstance(analysis, dict) and analysis:
+            show_analysis(analysis)
 
 # ---------------------------
 # Submit Journal Entry
@@ -586,12 +629,18 @@ elif choice == "Submit Journal Entry":
             st.stop()
 
         rep = first_report(resp) or {}
+        if rep.get("error"):
+            show_error(rep)
+            st.stop()
+
         st.success("Your journal entry has been saved.")
 
-        suggestions = rep.get("suggestions", "")
-        if isinstance(suggestions, str) and suggestions.strip():
+        suggestions = rep.get("suggestions", {})
+        if rep.get("failed_fields"):
+            st.warning("Supportive suggestions could not be generated right now.")
+        elif isinstance(suggestions, dict) and suggestions:
             st.subheader("Supportive suggestions")
-            st.write(suggestions)
+            show_plan(suggestions)
 
 # ---------------------------
 # Generate Recommendations
@@ -613,11 +662,15 @@ elif choice == "Generate Recommendations":
             st.stop()
 
         rep = first_report(resp) or {}
-        rec = rep.get("recommendations", "")
+        if rep.get("error"):
+            show_error(rep)
+            st.stop()
+
+        rec = rep.get("recommendations", {})
 
         st.success("Recommendations generated.")
-        if isinstance(rec, str) and rec.strip():
-            st.write(rec)
+        if isinstance(rec, dict) and rec:
+            show_plan(rec)
 
 # ---------------------------
 # Session Summary